@@ -29,6 +29,7 @@ import { Label } from "@/app/components/ui/label";
 import RoomAutocomplete from './RoomAutocomplete';
 import FileUpload from './FileUpload';
 import { Room, TopicFromAPI } from '@/app/lib/types'; // Ensure types path is correct
+import { downscaleImages } from '@/app/lib/image-utils';
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 const MAX_FILE_SIZE = 5 * 1024 * 1024; // 5MB
@@ -220,8 +221,9 @@ const CreateJobButton: React.FC<CreateJobButtonProps> = ({ propertyId, onJobCrea
           formData.append(key, valueToAppend);
       });
 
-      // Append files
-      values.files.forEach((file) => {
+      // Append files, shrunk client-side so large phone photos upload faster
+      const uploads = await downscaleImages(values.files);
+      uploads.forEach((file) => {
         formData.append('images', file); // Use 'images' to match Django backend expectation often
       });
 
@@ -18,6 +18,7 @@ import { Room, TopicFromAPI } from '@/app/lib/types';
 import { useRouter } from 'next/navigation';
 import { useProperty } from '@/app/lib/PropertyContext';
 import { useJob } from '@/app/lib/JobContext';
+import { downscaleImages } from '@/app/lib/image-utils';
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 const MAX_FILE_SIZE = 5 * 1024 * 1024; // 5MB
@@ -190,7 +191,8 @@ const CreateJobForm: React.FC<{ onJobCreated?: () => void }> = ({ onJobCreated }
       formData.append('property_id', selectedProperty);
       formData.append('is_defective', values.is_defective ? 'true' : 'false');
       formData.append('is_preventivemaintenance', values.is_preventivemaintenance ? 'true' : 'false');
-      values.files.forEach(file => {
+      const uploads = await downscaleImages(values.files);
+      uploads.forEach(file => {
         formData.append('images', file);
       });
 
@@ -1,6 +1,6 @@
 "use client";
 
-import React, { useState, useCallback, useEffect, ChangeEventHandler } from "react";
+import React, { useState, useCallback, useEffect, useRef, ChangeEventHandler } from "react";
 import Image from "next/image";
 import { Upload, X, AlertCircle } from "lucide-react";
 import { Button } from "@/app/components/ui/button";
@@ -120,21 +120,31 @@ const FileUpload: React.FC<FileUploadProps> = ({
     [handleFiles]
   );
 
-  const getFilePreview = useCallback(
-    (file: File) => {
-      return URL.createObjectURL(file);
-    },
-    []
-  );
+  // One object URL per file, keyed by the File so a preview always matches its file.
+  // URLs are created when a file is added and revoked when it is removed.
+  const previewUrlsRef = useRef(new Map<File, string>());
+  const [previewUrls, setPreviewUrls] = useState<Map<File, string>>(() => new Map());
+
+  useEffect(() => {
+    const current = previewUrlsRef.current;
+    const next = new Map<File, string>();
+    selectedFiles.forEach((file) => {
+      next.set(file, current.get(file) ?? URL.createObjectURL(file));
+    });
+    current.forEach((url, file) => {
+      if (!next.has(file)) URL.revokeObjectURL(url);
+    });
+    previewUrlsRef.current = next;
+    setPreviewUrls(next);
+  }, [selectedFiles]);
 
   useEffect(() => {
     // Cleanup object URLs to prevent memory leaks
     return () => {
-      selectedFiles.forEach((file) => {
-        URL.revokeObjectURL(getFilePreview(file));
-      });
+      previewUrlsRef.current.forEach((url) => URL.revokeObjectURL(url));
+      previewUrlsRef.current = new Map();
     };
-  }, [selectedFiles, getFilePreview]);
+  }, []);
 
   return (
     <div className="space-y-4">
@@ -193,13 +203,15 @@ const FileUpload: React.FC<FileUploadProps> = ({
             >
               {/* Image Preview */}
               <div className="relative w-16 h-16 flex-shrink-0">
-                <Image
-                  src={getFilePreview(file)}
-                  alt={`Preview ${index}`}
-                  fill
-                  className="object-cover rounded"
-                  sizes="64px"
-                />
+                {previewUrls.get(file) && (
+                  <Image
+                    src={previewUrls.get(file)!}
+                    alt={`Preview ${index}`}
+                    fill
+                    className="object-cover rounded"
+                    sizes="64px"
+                  />
+                )}
               </div>
               {/* File Info & Progress */}
               <div className="flex-1 min-w-0">
@@ -1,6 +1,6 @@
 "use client";
 
-import React, { useState, useCallback, useMemo, MouseEvent } from 'react';
+import React, { useState, useCallback, MouseEvent } from 'react';
 import { Card, CardContent, CardHeader, CardTitle } from "@/app/components/ui/card";
 import { UpdateStatusModal } from "./UpdateStatusModal";
 import { Job, JobStatus, Property } from "@/app/lib/types";
@@ -21,6 +21,15 @@ interface JobCardProps {
   properties?: Property[];
 }
 
+// Static per-status badge config, shared by every card instead of rebuilt per render
+const STATUS_CONFIG: Record<JobStatus, { icon: React.ReactNode; color: string; label: string }> = {
+  completed: { icon: <CheckCircle2 className="w-4 h-4" />, color: 'bg-green-100 text-green-800', label: 'Completed' },
+  in_progress: { icon: <Clock className="w-4 h-4" />, color: 'bg-blue-100 text-blue-800', label: 'In Progress' },
+  pending: { icon: <AlertCircle className="w-4 h-4" />, color: 'bg-yellow-100 text-yellow-800', label: 'Pending' },
+  cancelled: { icon: <AlertTriangle className="w-4 h-4" />, color: 'bg-red-100 text-red-800', label: 'Cancelled' },
+  waiting_sparepart: { icon: <ClipboardList className="w-4 h-4" />, color: 'bg-purple-100 text-purple-800', label: 'Waiting Sparepart' }
+};
+
 export function JobCard({ job, properties = [] }: JobCardProps) {
   const router = useRouter();
   const { selectedProperty } = useProperty();
@@ -82,17 +91,6 @@ export function JobCard({ job, properties = [] }: JobCardProps) {
     return propertyFromList?.name || 'N/A';
   }, [job, selectedProperty, properties]);
 
-  const getStatusConfig = (status: JobStatus) => {
-    const configs = {
-      completed: { icon: <CheckCircle2 className="w-4 h-4" />, color: 'bg-green-100 text-green-800', label: 'Completed' },
-      in_progress: { icon: <Clock className="w-4 h-4" />, color: 'bg-blue-100 text-blue-800', label: 'In Progress' },
-      pending: { icon: <AlertCircle className="w-4 h-4" />, color: 'bg-yellow-100 text-yellow-800', label: 'Pending' },
-      cancelled: { icon: <AlertTriangle className="w-4 h-4" />, color: 'bg-red-100 text-red-800', label: 'Cancelled' },
-      waiting_sparepart: { icon: <ClipboardList className="w-4 h-4" />, color: 'bg-purple-100 text-purple-800', label: 'Waiting Sparepart' }
-    };
-    return configs[status] || configs.pending;
-  };
-
   const formatDate = useCallback((dateString: string) => {
     try {
       return new Date(dateString).toLocaleString('en-US', {
@@ -108,7 +106,7 @@ export function JobCard({ job, properties = [] }: JobCardProps) {
     }
   }, []);
 
-  const statusConfig = useMemo(() => getStatusConfig(job.status), [job.status]);
+  const statusConfig = STATUS_CONFIG[job.status] || STATUS_CONFIG.pending;
 
   const handleThumbnailClick = (index: number, e: MouseEvent) => {
     e.stopPropagation();
@@ -159,6 +157,7 @@ export function JobCard({ job, properties = [] }: JobCardProps) {
                 src={job.images[selectedImage]?.image_url}
                 alt={`Job Image ${selectedImage + 1}`}
                 className="w-full h-full object-cover rounded-md"
+                sizes="(max-width: 640px) 100vw, (max-width: 1024px) 50vw, 33vw"
               />
             </div>
             {job.images.length > 1 && (
@@ -177,6 +176,7 @@ export function JobCard({ job, properties = [] }: JobCardProps) {
                       src={img.image_url}
                       alt={`Thumbnail ${index + 1}`}
                       className="w-full h-full object-cover"
+                      sizes="56px"
                     />
                   </button>
                 ))}
@@ -233,6 +233,7 @@ export function JobCard({ job, properties = [] }: JobCardProps) {
                     src={job.profile_image.profile_image}
                     alt={typeof job.user === 'object' && job.user ? job.user.username : String(job.user ?? 'Staff')}
                     className="w-full h-full object-cover rounded-full"
+                    sizes="40px"
                   />
                 ) : (
                   <div className="w-full h-full bg-gray-100 flex items-center justify-center">
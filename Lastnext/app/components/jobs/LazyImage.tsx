@@ -6,12 +6,12 @@ interface LazyImageProps {
   src: string;
   alt: string;
   className?: string;
+  sizes?: string; // Rendered width hint so small slots don't fetch full-width variants
 }
 
-export const LazyImage: React.FC<LazyImageProps> = ({ src, alt, className }) => {
-  // Check if this is a URL from our own domain
-  const isOwnDomain = src.includes('pmcs.site');
-  
+export const LazyImage: React.FC<LazyImageProps> = ({ src, alt, className, sizes = '100vw' }) => {
+  // pmcs.site media is allowed in next.config remotePatterns, so it goes through
+  // the optimizer like any other remote image and `sizes` picks the srcset variant
   return (
     <Image
       src={src}
@@ -19,10 +19,9 @@ export const LazyImage: React.FC<LazyImageProps> = ({ src, alt, className }) =>
       className={className}
       width={0}  // Required for remote images in Next.js 15
       height={0} // Required for remote images in Next.js 15
-      sizes="100vw" // Adjust based on layout
+      sizes={sizes}
       style={{ width: '100%', height: 'auto' }} // Responsive
       loading="lazy"
-      unoptimized={isOwnDomain} // Skip optimization for our own domain
       onError={() => console.error(`Failed to load image: ${src}`)} // Debug
     />
   );
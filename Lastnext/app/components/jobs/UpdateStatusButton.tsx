@@ -21,7 +21,7 @@ import {
 } from "@/app/components/ui/select";
 import { Label } from "@/app/components/ui/label";
 import { Job, JobStatus } from "@/app/lib/types";
-import { updateJob as apiUpdateJob } from "@/app/lib/data";
+import { updateJobStatus } from "@/app/lib/data";
 import { useToast } from "@/app/components/ui/use-toast";
 
 // Define status constants
@@ -75,26 +75,9 @@ const UpdateStatusButton: React.FC<UpdateStatusButtonProps> = ({
 
     setIsSubmitting(true);
     try {
-      // Create a minimal update payload that preserves all required fields
-      const updateData = {
-        status: selectedStatus,
-        // Include other fields from the original job that the API requires
-        // NOTE: This is the key fix - including required fields
-        room_id: job.rooms?.[0]?.room_id,
-        topic_data: job.topics?.[0] ? JSON.stringify({
-          title: job.topics[0].title,
-          description: job.topics[0].description || ""
-        }) : JSON.stringify({ title: "Unknown", description: "" }),
-        // Include other fields for completeness
-        description: job.description,
-        priority: job.priority,
-        remarks: job.remarks || "",
-        is_defective: job.is_defective || false,
-        is_preventivemaintenance: job.is_preventivemaintenance || false,
-      };
-
-      // Call API
-      const updatedJob = await apiUpdateJob(String(job.job_id), updateData);
+      // A status change only needs the status field; PATCH it instead of
+      // re-sending the whole job.
+      const updatedJob = await updateJobStatus(String(job.job_id), selectedStatus);
       
       // Update local state
       onStatusUpdated(updatedJob);
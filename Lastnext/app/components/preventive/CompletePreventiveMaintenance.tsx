@@ -36,6 +36,19 @@ export default function CompletePreventiveMaintenance({ params }: CompletePreven
   const [successMessage, setSuccessMessage] = useState<string | null>(null);
   const [completedDate, setCompletedDate] = useState<string>(new Date().toISOString().slice(0, 16)); // Local state for date
 
+  // One object URL per selected file (not per render), released when the file changes
+  const [afterImagePreviewUrl, setAfterImagePreviewUrl] = useState<string | null>(null);
+
+  useEffect(() => {
+    if (!completionData.after_image) {
+      setAfterImagePreviewUrl(null);
+      return;
+    }
+    const url = URL.createObjectURL(completionData.after_image);
+    setAfterImagePreviewUrl(url);
+    return () => URL.revokeObjectURL(url);
+  }, [completionData.after_image]);
+
   // Fetch maintenance record
   useEffect(() => {
     if (pmId) {
@@ -346,10 +359,10 @@ export default function CompletePreventiveMaintenance({ params }: CompletePreven
                       file:bg-blue-50 file:text-blue-700
                       hover:file:bg-blue-100"
                   />
-                  {completionData.after_image && (
+                  {afterImagePreviewUrl && (
                     <div className="mt-2 h-40 border border-gray-300 rounded-md overflow-hidden bg-gray-100">
                       <img 
-                        src={URL.createObjectURL(completionData.after_image)}
+                        src={afterImagePreviewUrl}
                         alt="After maintenance preview" 
                         className="h-full w-full object-contain"
                       />
@@ -15,7 +15,7 @@ import {
 } from '@/app/lib/preventiveMaintenanceModels';
 import apiClient from '@/app/lib/api-client';
 import FileUpload from '@/app/components/jobs/FileUpload';
-import { useToast } from '@/app/lib/hooks/use-toast';
+import { useToast } from '@/app/components/ui/use-toast';
 import { useProperty } from '@/app/lib/PropertyContext';
 import preventiveMaintenanceService, {
   type CreatePreventiveMaintenanceData,
@@ -282,6 +282,17 @@ const PreventiveMaintenanceForm: React.FC<PreventiveMaintenanceFormProps> = ({
     }
   }, [pmId, initialDataProp]);
 
+  // Release local object URLs once a preview is replaced, cleared or unmounted
+  useEffect(() => {
+    if (!beforeImagePreview?.startsWith('blob:')) return;
+    return () => URL.revokeObjectURL(beforeImagePreview);
+  }, [beforeImagePreview]);
+
+  useEffect(() => {
+    if (!afterImagePreview?.startsWith('blob:')) return;
+    return () => URL.revokeObjectURL(afterImagePreview);
+  }, [afterImagePreview]);
+
   const handleFileSelection = (
     files: File[],
     type: 'before' | 'after',
@@ -308,12 +319,10 @@ const PreventiveMaintenanceForm: React.FC<PreventiveMaintenanceFormProps> = ({
       return;
     }
     setFieldValue(type === 'before' ? 'before_image_file' : 'after_image_file', file);
-    const reader = new FileReader();
-    reader.onloadend = () => {
-      if (type === 'before') setBeforeImagePreview(reader.result as string);
-      else setAfterImagePreview(reader.result as string);
-    };
-    reader.readAsDataURL(file);
+    // An object URL points at the File itself; a data URL would copy it into a base64 string
+    const previewUrl = URL.createObjectURL(file);
+    if (type === 'before') setBeforeImagePreview(previewUrl);
+    else setAfterImagePreview(previewUrl);
   };
 
   const handleSubmit = async (values: FormValues, formikHelpers: FormikHelpers<FormValues>) => {
@@ -345,13 +354,6 @@ const PreventiveMaintenanceForm: React.FC<PreventiveMaintenanceFormProps> = ({
         after_image: hasAfterImageFile ? values.after_image_file! : undefined,
       };
 
-      console.log('[FORM] handleSubmit - Data prepared for service:', JSON.stringify(dataForService, (key, value) => {
-        if (value instanceof File) {
-          return { name: value.name, size: value.size, type: value.type, _isAFile: true };
-        }
-        return value;
-      }, 2));
-
       const maintenanceIdToUpdate = pmId || (actualInitialData?.pm_id ?? null);
       let response: ServiceResponse<PreventiveMaintenance>;
 
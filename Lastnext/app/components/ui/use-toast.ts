@@ -162,6 +162,19 @@ function toast({ ...props }: Toast) {
   }
 }
 
+toast.error = (message: string) =>
+  toast({
+    variant: "destructive",
+    title: "Error",
+    description: message,
+  })
+
+toast.success = (message: string) =>
+  toast({
+    title: "Success",
+    description: message,
+  })
+
 function useToast() {
   const [state, setState] = useState<State>(memoryState)
 
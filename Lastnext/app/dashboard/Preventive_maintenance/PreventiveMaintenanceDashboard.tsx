@@ -2,7 +2,7 @@
 
 import React, { useState, useEffect, useMemo } from 'react';
 import { usePreventiveMaintenanceJobs } from '@/app/lib/hooks/usePreventiveMaintenanceJobs';
-import { Job } from '@/app/lib/types';
+import { Job, JobStatus } from '@/app/lib/types';
 import { Card, CardContent, CardHeader, CardTitle, CardDescription, CardFooter } from '@/app/components/ui/card';
 import { Button } from '@/app/components/ui/button';
 import { Badge } from '@/app/components/ui/badge';
@@ -99,6 +99,20 @@ export default function PreventiveMaintenanceDashboard({
 
   // Apply filters to the jobs
   const filteredJobs = useMemo(() => {
+    // Work out the time-range cutoff once instead of allocating dates per job
+    const now = new Date();
+    const todayString = now.toDateString();
+    let rangeStart: number | null = null;
+    if (timeRangeFilter === 'week') {
+      const oneWeekAgo = new Date(now);
+      oneWeekAgo.setDate(now.getDate() - 7);
+      rangeStart = oneWeekAgo.getTime();
+    } else if (timeRangeFilter === 'month') {
+      const oneMonthAgo = new Date(now);
+      oneMonthAgo.setMonth(now.getMonth() - 1);
+      rangeStart = oneMonthAgo.getTime();
+    }
+
     return jobs.filter(job => {
       // Filter by status
       if (statusFilter !== 'all' && job.status !== statusFilter) {
@@ -111,24 +125,11 @@ export default function PreventiveMaintenanceDashboard({
       }
       
       // Filter by time range
-      if (timeRangeFilter !== 'all') {
-        const jobDate = new Date(job.created_at);
-        const now = new Date();
-        
-        switch (timeRangeFilter) {
-          case 'today':
-            return jobDate.toDateString() === now.toDateString();
-          case 'week':
-            const oneWeekAgo = new Date();
-            oneWeekAgo.setDate(now.getDate() - 7);
-            return jobDate >= oneWeekAgo;
-          case 'month':
-            const oneMonthAgo = new Date();
-            oneMonthAgo.setMonth(now.getMonth() - 1);
-            return jobDate >= oneMonthAgo;
-          default:
-            return true;
-        }
+      if (timeRangeFilter === 'today') {
+        return new Date(job.created_at).toDateString() === todayString;
+      }
+      if (rangeStart !== null) {
+        return new Date(job.created_at).getTime() >= rangeStart;
       }
       
       return true;
@@ -136,14 +137,26 @@ export default function PreventiveMaintenanceDashboard({
   }, [jobs, statusFilter, priorityFilter, timeRangeFilter]);
 
   // Group jobs by status for tab filtering
-  const jobsByStatus = useMemo(() => ({
-    pending: filteredJobs.filter(job => job.status === 'pending'),
-    in_progress: filteredJobs.filter(job => job.status === 'in_progress'),
-    completed: filteredJobs.filter(job => job.status === 'completed'),
-    waiting_sparepart: filteredJobs.filter(job => job.status === 'waiting_sparepart'),
-    cancelled: filteredJobs.filter(job => job.status === 'cancelled'),
-    is_PM: filteredJobs.filter(job => job.is_preventivemaintenance === true)
-  }), [filteredJobs]);
+  const jobsByStatus = useMemo(() => {
+    const groups: Record<JobStatus | 'is_PM', Job[]> = {
+      pending: [],
+      in_progress: [],
+      completed: [],
+      waiting_sparepart: [],
+      cancelled: [],
+      is_PM: []
+    };
+
+    // Single pass instead of one filter per tab
+    for (const job of filteredJobs) {
+      groups[job.status]?.push(job);
+      if (job.is_preventivemaintenance === true) {
+        groups.is_PM.push(job);
+      }
+    }
+
+    return groups;
+  }, [filteredJobs]);
 
   // Calculate upcoming maintenance in the next 30 days
   const upcomingMaintenance = useMemo(() => {
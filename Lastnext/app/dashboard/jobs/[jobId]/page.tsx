@@ -1,4 +1,4 @@
-import { notFound } from 'next/navigation';
+import { notFound, unstable_rethrow } from 'next/navigation';
 import { fetchJob, fetchProperties } from '@/app/lib/data.server';
 import { getServerSession } from 'next-auth/next';
 import { authOptions } from '@/app/lib/auth';
@@ -51,14 +51,26 @@ export default async function JobPage({ params }: Props) {
     const session = await getServerSession(authOptions);
     const accessToken = session?.user?.accessToken;
 
-    // Fetch job and properties
-    const job = await fetchJob(jobId, accessToken);
-    const properties = await fetchProperties(accessToken);
+    // Fetch job and properties concurrently; neither depends on the other.
+    // Settle the job first so a missing job 404s even if properties fail.
+    const [jobResult, propertiesResult] = await Promise.allSettled([
+      fetchJob(jobId, accessToken),
+      fetchProperties(accessToken),
+    ]);
 
+    if (jobResult.status === 'rejected') {
+      throw jobResult.reason;
+    }
+    const job = jobResult.value;
     if (!job) {
       notFound();
     }
 
+    if (propertiesResult.status === 'rejected') {
+      throw propertiesResult.reason;
+    }
+    const properties = propertiesResult.value;
+
     const formatDate = (dateString: string) => {
       return new Date(dateString).toLocaleString('en-US', {
         year: 'numeric',
@@ -230,6 +242,8 @@ export default async function JobPage({ params }: Props) {
       </div>
     );
   } catch (error) {
+    // Let notFound() reach Next.js instead of turning it into a generic error
+    unstable_rethrow(error);
     console.error(`Error loading job page for jobId=${await params.then(p => p.jobId)}:`, error);
     throw new Error('Failed to load job page. Please try again later.');
   }
@@ -86,7 +86,6 @@ async function getPreventiveMaintenance(pmId: string): Promise<PreventiveMainten
     }
 
     const data = await response.json();
-    console.log("[SERVER_FETCH] Received maintenance data:", JSON.stringify(data, null, 2));
     return data as PreventiveMaintenance;
   } catch (error) {
     console.error(`[SERVER_FETCH] Exception while fetching maintenance data for ${pmId}:`, error);
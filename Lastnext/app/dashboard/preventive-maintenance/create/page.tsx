@@ -15,9 +15,6 @@ function CreatePageContent() {
 
   // Handle successful form submission
   const handleSuccess = (data: PreventiveMaintenance) => {
-    // Log the full data structure for debugging
-    console.log('Form submitted successfully with data:', JSON.stringify(data));
-    
     // Store the data in state for possible use in the UI
     setSubmittedData(data);
     setIsSubmitted(true);
@@ -17,13 +17,29 @@ export default async function RoomDetailPage({ params }: Props) {
   const session = await getServerSession(authOptions);
   const accessToken = session?.user?.accessToken;
 
-  const room = await fetchRoom(room_id, accessToken);
+  // The three requests are independent, so issue them together, but settle the
+  // room first so a missing room still 404s even if the other requests fail.
+  const [roomResult, propertiesResult, jobsResult] = await Promise.allSettled([
+    fetchRoom(room_id, accessToken),
+    fetchProperties(accessToken),
+    fetchJobsForRoom(room_id, accessToken),
+  ]);
+  if (roomResult.status === 'rejected') {
+    throw roomResult.reason;
+  }
+  const room = roomResult.value;
   if (!room) {
     notFound();
   }
 
-  const properties = await fetchProperties(accessToken);
-  const jobs = await fetchJobsForRoom(room_id, accessToken);
+  if (propertiesResult.status === 'rejected') {
+    throw propertiesResult.reason;
+  }
+  if (jobsResult.status === 'rejected') {
+    throw jobsResult.reason;
+  }
+  const properties = propertiesResult.value;
+  const jobs = jobsResult.value;
 
   return (
     <Suspense fallback={<LoadingSkeleton />}>
@@ -104,17 +104,11 @@ class PreventiveMaintenanceService {
         console.log(`Adding after image: ${data.after_image.name} (${data.after_image.size} bytes)`);
       }
 
-      console.log('FormData entries (create):');
-      for (const [key, value] of formData.entries()) {
-        console.log(`  ${key}: ${value instanceof File ? `${value.name} (${value.size} bytes)` : value}`);
-      }
-
       const createResponse = await apiClient.post<any>(`${this.baseUrl}/`, formData, {
         headers: { 'Content-Type': 'multipart/form-data' },
       });
 
       const responseData = createResponse.data;
-      console.log('Raw API response:', responseData);
 
       let actualRecord: PreventiveMaintenance;
 
@@ -166,11 +160,6 @@ class PreventiveMaintenanceService {
         console.log(`Adding after image: ${data.after_image!.name} (${data.after_image!.size} bytes)`);
       }
 
-      console.log('FormData entries:');
-      for (const [key, value] of imageFormData.entries()) {
-        console.log(`  ${key}: ${value instanceof File ? `${value.name} (${value.size} bytes)` : value}`);
-      }
-
       await apiClient.post(`${this.baseUrl}/${pmId}/upload-images/`, imageFormData, {
         headers: { 'Content-Type': 'multipart/form-data' },
       });
@@ -246,11 +235,6 @@ class PreventiveMaintenanceService {
         console.log(`Adding after image: ${data.after_image.name} (${data.after_image.size} bytes)`);
       }
 
-      console.log('FormData entries (update):');
-      for (const [key, value] of formData.entries()) {
-        console.log(`  ${key}: ${value instanceof File ? `${value.name} (${value.size} bytes)` : value}`);
-      }
-
       const response = await apiClient.put<PreventiveMaintenance>(
         `${this.baseUrl}/${id}/`,
         formData,
@@ -287,11 +271,6 @@ class PreventiveMaintenanceService {
         console.log(`Adding after image: ${data.after_image.name} (${data.after_image.size} bytes)`);
       }
 
-      console.log('FormData entries (complete):');
-      for (const [key, value] of formData.entries()) {
-        console.log(`  ${key}: ${value instanceof File ? `${value.name} (${value.size} bytes)` : value}`);
-      }
-
       const response = await apiClient.post<PreventiveMaintenance>(
         `${this.baseUrl}/${id}/complete/`,
         formData,
@@ -14,9 +14,7 @@ export default class TopicService {
 
   async getTopics(): Promise<ServiceResponse<Topic[]>> {
     try {
-      console.log('Fetching topics');
       const response = await apiClient.get<Topic[]>(this.baseUrl);
-      console.log('Topics received:', response.data);
       return { success: true, data: response.data };
     } catch (error: any) {
       console.error('Service error fetching topics:', error);
@@ -65,6 +65,7 @@ if (process.env.NODE_ENV === 'development') {
 // --- Retry Configuration ---
 const MAX_RETRIES = 2;
 const RETRY_DELAY = 1000; // 1 second between retries
+const RETRYABLE_STATUSES = new Set([502, 503, 504]); // Gateway errors worth retrying
 
 // Helper function to delay execution
 const delay = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
@@ -96,6 +97,7 @@ async function refreshToken(refreshTokenValue: string): Promise<string | null> {
        // If refresh fails (e.g., 401 Unauthorized), log out user
        if (response.status === 401) {
             console.error("[Auth] Refresh token failed or expired. Logging out.");
+            resetAuthCache();
             await signOut({ redirect: false });
        }
        throw new ApiError(`Token refresh failed with status: ${response.status}`, response.status);
@@ -114,6 +116,58 @@ async function refreshToken(refreshTokenValue: string): Promise<string | null> {
   }
 }
 
+// Decoding the same access token on every request is wasted work; remember the
+// expiry of the last token seen. Tokens only change on sign-in or refresh.
+let lastDecodedToken: string | null = null;
+let lastDecodedExp: number | undefined;
+
+function getTokenExpiry(accessToken: string): number | undefined {
+  if (accessToken !== lastDecodedToken) {
+    lastDecodedExp = jwtDecode<JwtToken>(accessToken).exp;
+    lastDecodedToken = accessToken;
+  }
+  return lastDecodedExp;
+}
+
+// Tokens refreshed here are not written back into the next-auth session, so the
+// session keeps returning the stale token. Remember which token was replaced and
+// by what, so later requests reuse the new token instead of refreshing again.
+let refreshedFrom: string | null = null;
+let refreshedAccessToken: string | null = null;
+
+function rememberRefreshedToken(staleToken: string | undefined, newToken: string): void {
+  if (!staleToken) return;
+  refreshedFrom = staleToken;
+  refreshedAccessToken = newToken;
+}
+
+// getSession() is a round trip to /api/auth/session. Bursts of API calls
+// (e.g. a page loading several resources) share one lookup for a few seconds.
+const SESSION_CACHE_TTL = 5000; // 5 seconds
+let sessionPromise: ReturnType<typeof getSession> | null = null;
+let sessionFetchedAt = 0;
+
+function getCachedSession(): ReturnType<typeof getSession> {
+  if (!sessionPromise || Date.now() - sessionFetchedAt > SESSION_CACHE_TTL) {
+    sessionFetchedAt = Date.now();
+    sessionPromise = getSession().catch((error) => {
+      sessionPromise = null; // Don't cache failures
+      throw error;
+    });
+  }
+  return sessionPromise;
+}
+
+// Forget the cached session and any remembered refreshed token when signing out
+// or when a refresh fails, so requests made before the page reacts don't keep
+// sending the signed-out session's tokens.
+function resetAuthCache(): void {
+  sessionPromise = null;
+  sessionFetchedAt = 0;
+  refreshedFrom = null;
+  refreshedAccessToken = null;
+}
+
 // --- Axios Interceptors ---
 
 // Request Interceptor: Add token, handle expiry before sending
@@ -125,8 +179,11 @@ apiClient.interceptors.request.use(
         return config;
     }
 
-    const session = await getSession();
-    const accessToken = session?.user?.accessToken;
+    const session = await getCachedSession();
+    const sessionAccessToken = session?.user?.accessToken;
+    const accessToken = sessionAccessToken && sessionAccessToken === refreshedFrom && refreshedAccessToken
+      ? refreshedAccessToken
+      : sessionAccessToken;
     const refreshTokenValue = session?.user?.refreshToken;
 
     if (!accessToken) {
@@ -135,16 +192,17 @@ apiClient.interceptors.request.use(
     }
 
     try {
-      const decoded = jwtDecode<JwtToken>(accessToken);
+      const exp = getTokenExpiry(accessToken);
       const currentTime = Math.floor(Date.now() / 1000);
 
       // Check if token is expired (add a small buffer, e.g., 60 seconds)
       const buffer = 60;
-      if (decoded.exp && decoded.exp < currentTime + buffer) {
+      if (exp && exp < currentTime + buffer) {
         console.log("[RequestInterceptor] Access token expired or needs refresh.");
 
         if (!refreshTokenValue) {
             console.error("[RequestInterceptor] Access token expired, but no refresh token available. Logging out.");
+            resetAuthCache();
             await signOut({ redirect: false });
             throw new ApiError("Session expired, no refresh token.", 401);
         }
@@ -180,9 +238,11 @@ apiClient.interceptors.request.use(
 
             if (newToken) {
                 console.log("[RequestInterceptor] Applying newly refreshed token to current request.");
+                rememberRefreshedToken(sessionAccessToken, newToken);
                 config.headers.Authorization = `Bearer ${newToken}`;
             } else {
                 console.error("[RequestInterceptor] Token refresh failed, request might fail or proceed without auth.");
+                resetAuthCache();
                 delete config.headers.Authorization;
             }
         } catch (refreshError) {
@@ -190,6 +250,7 @@ apiClient.interceptors.request.use(
             isRefreshing = false;
             refreshPromise = null;
             processPendingRequests(null);
+            resetAuthCache();
             delete config.headers.Authorization;
             throw new ApiError("Session refresh failed.", 401);
         }
@@ -243,9 +304,12 @@ apiClient.interceptors.response.use(
       console.log(`[ResponseInterceptor] Received 401, attempt ${originalRequest._retry + 1}/${MAX_RETRIES}.`);
       originalRequest._retry++;
 
-      const session = await getSession();
+      // A 401 means the cached session may be stale; look it up again
+      sessionPromise = null;
+      const session = await getCachedSession();
       if (!session?.user?.refreshToken) {
           console.error("[ResponseInterceptor] 401 received, but no refresh token available. Logging out.");
+          resetAuthCache();
           await signOut({ redirect: false });
           return Promise.reject(new ApiError("Session expired or invalid.", 401));
       }
@@ -267,10 +331,13 @@ apiClient.interceptors.response.use(
 
           if (!newToken) {
               console.error("[ResponseInterceptor] Token refresh failed after 401. Cannot retry request.");
+              resetAuthCache();
               await signOut({ redirect: false });
               return Promise.reject(new ApiError("Session refresh failed.", 401));
           }
 
+          rememberRefreshedToken(session.user.accessToken, newToken);
+
           // Update the header of the original request config for retry
           if (originalRequest.headers) {
               console.log("[ResponseInterceptor] Retrying original request with new token.");
@@ -286,13 +353,14 @@ apiClient.interceptors.response.use(
           refreshPromise = null;
           processPendingRequests(null);
           // Logout if refresh fails definitively
+          resetAuthCache();
           await signOut({ redirect: false });
           return Promise.reject(new ApiError("Session refresh failed.", 401));
       }
     }
     
     // Network errors - retry with backoff for non-401 responses
-    if (error.response && [502, 503, 504].includes(error.response.status) && originalRequest._retry < MAX_RETRIES) {
+    if (error.response && RETRYABLE_STATUSES.has(error.response.status) && originalRequest._retry < MAX_RETRIES) {
       console.log(`[ResponseInterceptor] Network error ${error.response.status}, attempt ${originalRequest._retry + 1}/${MAX_RETRIES}.`);
       originalRequest._retry++;
       
@@ -368,7 +436,6 @@ export const handleApiError = (error: unknown): ApiError => {
 export async function fetchData<T>(url: string, config?: AxiosRequestConfig): Promise<T> {
   try {
     const response = await apiClient.get<T>(url, config);
-    console.log(`[fetchData] Response for ${url}: Status=${response.status}`);
     return response.data;
   } catch (error) {
     console.error(`[fetchData] Error caught for ${url}. Propagating processed error.`);
@@ -11,6 +11,14 @@ const API_BASE_URL =
   process.env.NEXT_PUBLIC_API_URL ||
   (process.env.NODE_ENV === "development" ? "http://localhost:8000" : "https://pmcs.site");
 
+// Columns authorize() actually reads; skips the stored token columns on every sign-in.
+const AUTH_USER_SELECT = {
+  email: true,
+  profile_image: true,
+  positions: true,
+  created_at: true,
+} as const;
+
 export const authOptions: NextAuthOptions = {
   providers: [
     CredentialsProvider({
@@ -56,6 +64,7 @@ export const authOptions: NextAuthOptions = {
           /** 🔹 Step 3: Fetch user from Prisma database */
           let user = await prisma.user.findUnique({
             where: { id: userId },
+            select: AUTH_USER_SELECT,
           });
 
           /** 🔹 Step 4: Fetch user profile from API */
@@ -89,6 +98,7 @@ export const authOptions: NextAuthOptions = {
                 positions: profileData.positions || "User",
                 created_at: profileData.created_at ? new Date(profileData.created_at) : new Date(),
               },
+              select: AUTH_USER_SELECT,
             });
           }
 
@@ -102,7 +112,6 @@ export const authOptions: NextAuthOptions = {
               name: prop.name || `Property ${prop.id}`,
               description: prop.description || "",
               created_at: prop.created_at || new Date().toISOString(),
-              users: prop.users || [],
             }));
           } else {
             try {
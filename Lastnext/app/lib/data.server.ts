@@ -1,3 +1,4 @@
+import { cache } from "react";
 import { Job, Property, JobStatus, Room } from "./types";
 
 const API_BASE_URL =
@@ -39,18 +40,21 @@ export async function fetchWithToken<T>(
     options.body = JSON.stringify(body);
   }
 
-  console.log(`${method} ${url}`, options);
-
   try {
     const response = await fetch(url, options);
     const responseText = await response.text();
 
-    console.log(
-      "Response Status:",
-      response.status,
-      "Preview:",
-      responseText.length > 200 ? responseText.substring(0, 200) + "..." : responseText
-    );
+    // Request tracing is only useful locally; in production it runs on every
+    // server render. The request options are left out since they carry the token.
+    if (process.env.NODE_ENV === "development") {
+      console.log(
+        `${method} ${url}`,
+        "Response Status:",
+        response.status,
+        "Preview:",
+        responseText.length > 200 ? responseText.substring(0, 200) + "..." : responseText
+      );
+    }
 
     if (!response.ok) {
       const contentType = response.headers.get("content-type");
@@ -109,14 +113,18 @@ export async function fetchJobs(accessToken?: string): Promise<Job[]> {
   return fetchWithToken<Job[]>(`${API_BASE_URL}/api/jobs/`, accessToken);
 }
 
-export async function fetchJob(jobId: string, accessToken?: string): Promise<Job | null> {
+// Wrapped in React's cache() so the job page's generateMetadata and body share
+// one request per render.
+export const fetchJob = cache(async (jobId: string, accessToken?: string): Promise<Job | null> => {
   try {
     return await fetchWithToken<Job>(`${API_BASE_URL}/api/jobs/${jobId}/`, accessToken);
   } catch (error) {
+    // Only a missing job maps to null (and a 404 page); let real failures surface
+    if (error instanceof ApiError && error.status === 404) return null;
     console.error(`Error fetching job ${jobId}:`, error);
-    return null;
+    throw error;
   }
-}
+});
 
 export async function updateJob(
   jobId: string,
@@ -146,8 +154,10 @@ export async function fetchRoom(roomId: string, accessToken?: string): Promise<R
   try {
     return await fetchWithToken<Room>(`${API_BASE_URL}/api/rooms/${roomId}/`, accessToken);
   } catch (error) {
+    // Only a missing room maps to null (and a 404 page); let real failures surface
+    if (error instanceof ApiError && error.status === 404) return null;
     console.error(`Error fetching room ${roomId}:`, error);
-    return null;
+    throw error;
   }
 }
 
@@ -327,8 +327,14 @@ export function usePreventiveMaintenanceJobs({
 
   const getStats = useCallback((): PMJobsStats => {
     const total = jobs.length;
-    const completed = jobs.filter(job => job.status === 'completed').length;
-    const active = jobs.filter(job => job.status !== 'completed' && job.status !== 'cancelled').length;
+    // Count in one pass rather than building a filtered array per figure
+    let completed = 0;
+    let cancelled = 0;
+    for (const job of jobs) {
+      if (job.status === 'completed') completed++;
+      else if (job.status === 'cancelled') cancelled++;
+    }
+    const active = total - completed - cancelled;
     const completionRate = total > 0 ? (completed / total) * 100 : 0;
     
     return {
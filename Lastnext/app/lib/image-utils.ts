@@ -0,0 +1,103 @@
+// ./app/lib/image-utils.ts
+
+// Longest edge we keep for uploaded job photos. The backend resizes to 800px
+// anyway, so anything much larger is just extra bytes to send and decode.
+const MAX_UPLOAD_DIMENSION = 1600;
+const WEBP_QUALITY = 0.82;
+const JPEG_QUALITY = 0.85;
+
+// Formats the browser can't re-encode without losing something (animation, vectors).
+const PASSTHROUGH_TYPES = ['image/gif', 'image/svg+xml'];
+
+/**
+ * Read the intrinsic size of an image without decoding its pixels.
+ */
+function readImageSize(file: File): Promise<{ width: number; height: number }> {
+  return new Promise((resolve, reject) => {
+    const url = URL.createObjectURL(file);
+    const img = new Image();
+    img.onload = () => {
+      URL.revokeObjectURL(url);
+      resolve({ width: img.naturalWidth, height: img.naturalHeight });
+    };
+    img.onerror = () => {
+      URL.revokeObjectURL(url);
+      reject(new Error(`Unable to read image: ${file.name}`));
+    };
+    img.src = url;
+  });
+}
+
+function canvasToBlob(canvas: HTMLCanvasElement, type: string, quality: number): Promise<Blob | null> {
+  return new Promise((resolve) => canvas.toBlob(resolve, type, quality));
+}
+
+/**
+ * Encode as WebP, which the backend stores anyway, falling back to JPEG on
+ * browsers whose canvas can't produce WebP (they silently return PNG instead).
+ */
+async function encodeCanvas(canvas: HTMLCanvasElement): Promise<Blob | null> {
+  const webp = await canvasToBlob(canvas, 'image/webp', WEBP_QUALITY);
+  if (webp?.type === 'image/webp') return webp;
+  return canvasToBlob(canvas, 'image/jpeg', JPEG_QUALITY);
+}
+
+/**
+ * Downscale a photo in the browser before it is uploaded.
+ * createImageBitmap is given the target size so the decoder can produce the
+ * smaller bitmap directly instead of materialising the full-resolution image.
+ * Returns the original file if it is already small enough or can't be processed.
+ */
+export async function downscaleImage(file: File, maxDimension: number = MAX_UPLOAD_DIMENSION): Promise<File> {
+  if (typeof window === 'undefined' || typeof createImageBitmap !== 'function') return file;
+  if (!file.type.startsWith('image/') || PASSTHROUGH_TYPES.includes(file.type)) return file;
+
+  try {
+    const { width, height } = await readImageSize(file);
+    const scale = maxDimension / Math.max(width, height);
+    if (!Number.isFinite(scale) || scale >= 1) return file;
+
+    const targetWidth = Math.round(width * scale);
+    const targetHeight = Math.round(height * scale);
+
+    const bitmap = await createImageBitmap(file, {
+      resizeWidth: targetWidth,
+      resizeHeight: targetHeight,
+      resizeQuality: 'high',
+      imageOrientation: 'from-image',
+    });
+
+    const canvas = document.createElement('canvas');
+    canvas.width = targetWidth;
+    canvas.height = targetHeight;
+    const ctx = canvas.getContext('2d');
+    if (!ctx) {
+      bitmap.close();
+      return file;
+    }
+    // Draw at the target size in case the engine ignored resizeWidth/resizeHeight
+    ctx.drawImage(bitmap, 0, 0, targetWidth, targetHeight);
+    // The pixels now live in the canvas; release the decoded bitmap right away.
+    bitmap.close();
+
+    const blob = await encodeCanvas(canvas);
+    // Drop the canvas backing store before the File copy is made.
+    canvas.width = 0;
+    canvas.height = 0;
+    if (!blob || blob.size >= file.size) return file;
+
+    const baseName = file.name.replace(/\.[^.]+$/, '');
+    const extension = blob.type === 'image/webp' ? 'webp' : 'jpg';
+    return new File([blob], `${baseName}.${extension}`, { type: blob.type, lastModified: file.lastModified });
+  } catch (error) {
+    console.warn(`[downscaleImage] Uploading ${file.name} unmodified:`, error);
+    return file;
+  }
+}
+
+/**
+ * Downscale a batch of photos concurrently, preserving their order.
+ */
+export function downscaleImages(files: File[], maxDimension?: number): Promise<File[]> {
+  return Promise.all(files.map((file) => downscaleImage(file, maxDimension)));
+}
@@ -22,42 +22,19 @@ export async function getUserProperties(userId: string): Promise<Property[]> {
         up."userId" = ${userId}
     `;
 
-    // The result is an array of raw DB objects
-    if (Array.isArray(result) && result.length > 0) {
-      return result.map((prop: any) => ({
-        id: prop.id,
-        property_id: String(prop.id),
-        name: prop.name || `Property ${prop.id}`,
-        description: prop.description || "",
-        created_at: typeof prop.created_at === 'object' && prop.created_at !== null 
-          ? prop.created_at.toISOString() 
-          : (prop.created_at || new Date().toISOString()),
-      }));
-    }
-    
-    // Fallback: Query through the join table directly
-    const propertiesFromJoin = await prisma.userProperty.findMany({
-      where: { userId: userId },
-      include: { property: true },
-    });
+    // The result is an array of raw DB objects. An empty result is final:
+    // re-querying the join table through Prisma would run the same join again.
+    if (!Array.isArray(result)) return [];
 
-    if (Array.isArray(propertiesFromJoin) && propertiesFromJoin.length > 0) {
-      return propertiesFromJoin.map((relation) => {
-        const prop = relation.property;
-        return {
-          id: prop.id, 
-          property_id: String(prop.id),
-          name: prop.name || `Property ${prop.id}`,
-          description: prop.description || "",
-          created_at: typeof prop.created_at === 'object' && prop.created_at !== null 
-            ? prop.created_at.toISOString() 
-            : (prop.created_at || new Date().toISOString()),
-        };
-      });
-    }
-    
-    // Return empty array if all methods fail
-    return [];
+    return result.map((prop: any) => ({
+      id: prop.id,
+      property_id: String(prop.id),
+      name: prop.name || `Property ${prop.id}`,
+      description: prop.description || "",
+      created_at: typeof prop.created_at === 'object' && prop.created_at !== null 
+        ? prop.created_at.toISOString() 
+        : (prop.created_at || new Date().toISOString()),
+    }));
   } catch (error) {
     console.error("Error fetching user properties:", error);
     return [];
@@ -69,25 +46,11 @@ export async function getUserProperties(userId: string): Promise<Property[]> {
  * This will handle the many-to-many relationship
  */
 export async function addUserToProperty(userId: string, propertyId: string): Promise<void> {
-  // First check if the relationship already exists
-  const existingRelation = await prisma.userProperty.findUnique({
-    where: {
-      userId_propertyId: {
-        userId: userId,
-        propertyId: propertyId
-      }
-    }
+  // Insert the link, ignoring it if it already exists (one round trip, no race)
+  await prisma.userProperty.createMany({
+    data: [{ userId, propertyId }],
+    skipDuplicates: true,
   });
-
-  // If it doesn't exist, create it
-  if (!existingRelation) {
-    await prisma.userProperty.create({
-      data: {
-        userId: userId,
-        propertyId: propertyId
-      }
-    });
-  }
 }
 
 /**
@@ -97,12 +60,11 @@ export async function createPropertyForUser(
   userId: string, 
   propertyData: { name: string; description?: string }
 ): Promise<Property> {
-  // Create the property
+  // Create the property and its UserProperty link in a single nested write
   const newProperty = await prisma.property.create({
     data: {
       name: propertyData.name,
       description: propertyData.description || null,
-      // Try to use the connect pattern if your schema supports it
       users: {
         create: {
           userId: userId
@@ -111,18 +73,6 @@ export async function createPropertyForUser(
     },
   });
 
-  // If the above creation with relationship fails, create the relationship manually
-  try {
-    await prisma.userProperty.create({
-      data: {
-        userId: userId,
-        propertyId: newProperty.id
-      }
-    });
-  } catch (error) {
-    console.error("Error creating relationship, may already exist:", error);
-  }
-
   return {
     id: newProperty.id,
     property_id: newProperty.id,
@@ -151,7 +101,7 @@ export async function syncUserProperties(
     const name = prop.name || `Property ${propertyId}`;
     
     // Upsert the property
-    const property = await prisma.property.upsert({
+    return prisma.property.upsert({
       where: { id: propertyId },
       update: {
         name,
@@ -163,32 +113,19 @@ export async function syncUserProperties(
         description: prop.description || null,
       },
     });
-
-    // Check if the relationship exists
-    const existingRelation = await prisma.userProperty.findUnique({
-      where: {
-        userId_propertyId: {
-          userId: userId,
-          propertyId: property.id
-        }
-      }
-    });
-
-    // If relationship doesn't exist, create it
-    if (!existingRelation) {
-      await prisma.userProperty.create({
-        data: {
-          userId: userId,
-          propertyId: property.id
-        }
-      });
-    }
-
-    return property;
   });
 
   // Wait for all property operations to complete
   const results = await Promise.all(propertyPromises);
+
+  // Link the user to every property in one INSERT; existing links are skipped
+  await prisma.userProperty.createMany({
+    data: results.map(property => ({
+      userId: userId,
+      propertyId: property.id
+    })),
+    skipDuplicates: true,
+  });
   
   // Convert to our application Property type
   return results.map(prop => ({
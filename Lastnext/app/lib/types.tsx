@@ -292,11 +292,6 @@ export type PageProps<TParams = { jobId: string }, TSearchParams = { [key: strin
   params: TParams;
   searchParams: TSearchParams;
 };
-export interface PaginationProps {
-  totalPages: number;
-  currentPage: number;
-  onPageChange: (page: number) => void;
-}
 export interface ServiceResponse<T> {
   success: boolean;
   data?: T;
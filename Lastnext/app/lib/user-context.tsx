@@ -58,21 +58,22 @@ export function UserProvider({ children }: { children: React.ReactNode }) {
     try {
       console.log('Fetching user profile and properties...');
       
-      // Fetch user profile
-      const profileResponse = await fetch(`${API_URL}/api/user-profiles/`, {
-        credentials: 'include',
-        headers: {
-          'Content-Type': 'application/json',
-          Authorization: `Bearer ${session.user.accessToken}`,
-        },
-      });
+      const headers = {
+        'Content-Type': 'application/json',
+        Authorization: `Bearer ${session.user.accessToken}`,
+      };
+
+      // Profile and properties are independent; fetch them concurrently
+      const [profileResponse, propertiesResponse] = await Promise.all([
+        fetch(`${API_URL}/api/user-profiles/`, { credentials: 'include', headers }),
+        fetch(`${API_URL}/api/properties/`, { credentials: 'include', headers }),
+      ]);
 
       if (!profileResponse.ok) {
         throw new Error(`Failed to fetch profile: ${profileResponse.status}`);
       }
 
       const profileDataArray = await profileResponse.json();
-      console.log('Profile data array:', profileDataArray);
       
       // Get the first profile or handle empty array
       const profileData = Array.isArray(profileDataArray) && profileDataArray.length > 0 
@@ -82,24 +83,12 @@ export function UserProvider({ children }: { children: React.ReactNode }) {
       if (!profileData) {
         throw new Error('No profile data found');
       }
-      
-      console.log('Selected profile data:', profileData);
-
-      // Fetch properties
-      const propertiesResponse = await fetch(`${API_URL}/api/properties/`, {
-        credentials: 'include',
-        headers: {
-          'Content-Type': 'application/json',
-          Authorization: `Bearer ${session.user.accessToken}`,
-        },
-      });
 
       if (!propertiesResponse.ok) {
         throw new Error(`Failed to fetch properties: ${propertiesResponse.status}`);
       }
 
       const propertiesData = await propertiesResponse.json();
-      console.log('Fetched properties:', propertiesData);
       
       // Ensure each property has a valid property_id
       const normalizedProperties = propertiesData.map((property: any) => {
@@ -119,8 +108,6 @@ export function UserProvider({ children }: { children: React.ReactNode }) {
         created_at: profileData.created_at,
         properties: normalizedProperties
       };
-      
-      console.log('Final user profile:', profile);
 
       setUserProfile(profile);
       setLastFetched(Date.now());